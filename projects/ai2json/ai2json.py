@@ -19,12 +19,18 @@
 #\/ ----------
 
 import json
+import codecs
+import locale
+import asyncio
 import subprocess
 from typing import Any
 from pathlib import Path
 from abc import abstractmethod
 from projects.ai2json.index import AI2JSON
 
+# Characters encoded and written to the CLI stdin per step in aexec
+_STDIN_CHUNK = 1 << 16
+
 # Base class for CLI-invoked AI reviewers; concrete implementations (Codex, Claude) are in ./ai/
 class TheAI2JSON(AI2JSON):
     def __init__(self, tmp: str | None = None):
@@ -61,32 +67,84 @@ class TheAI2JSON(AI2JSON):
                 timeout=timeout,
                 input=stdin_prompt,
             )
-            if completed.returncode != 0:
-                # Capture first 2000 chars of stderr to preserve diagnostic information
-                stderr_msg = completed.stderr[:2000] if completed.stderr else "no stderr"
-                return None, f"[ERR] subprocess.run: returncode={completed.returncode}, stderr: {stderr_msg}"
-
-            self._dump('stdout.txt', completed.stdout)
-
-            # Two-stage JSON extraction for resilience against varied AI output formats:
-            # Primary: subclass-specific parser → Fallback: direct fenced JSON extraction
-            payload, err = self._parse_stdout(completed.stdout)
-            if payload is None: # Fallback: extract fenced JSON directly from stdout, then parse
-                print("[WARNING] exec: Fallback to find fenced payload")
-                payload = self._strip_fence(completed.stdout)
-                if payload is None:
-                    return None, err
-
-            data, err = self._extract_json(payload)
-            if data is None:
-                return None, err
-
-            return data, None
+            return self._result(completed.returncode, completed.stdout, completed.stderr)
         except subprocess.TimeoutExpired as e:
             return None, f"[ERR] subprocess.TimeoutExpired: {e}"
         except Exception as e:
             return None, f"[ERR] subprocess.Exception: {e}"
 
+    async def aexec(self, args: list[str], timeout: int, stdin_prompt: str | None = None) -> tuple[Any, str | None]:
+        # Async counterpart of exec(); the CLI process is killed on timeout or task cancellation
+        try:
+            proc = await asyncio.create_subprocess_exec(
+                *args,
+                stdin=asyncio.subprocess.PIPE if stdin_prompt is not None else None,
+                stdout=asyncio.subprocess.PIPE,
+                stderr=asyncio.subprocess.PIPE,
+            )
+            encoding = locale.getpreferredencoding(False)  # Same codec subprocess.run(text=True) uses
+            try:
+                stdout, stderr = await asyncio.wait_for(self._communicate(proc, stdin_prompt, encoding), timeout)
+            except BaseException:
+                if proc.returncode is None:  # Don't leave an abandoned CLI running in the background
+                    proc.kill()
+                    await proc.wait()
+                raise
+            return self._result(proc.returncode, stdout.decode(encoding), stderr.decode(encoding))
+        except asyncio.TimeoutError:
+            return None, f"[ERR] subprocess.TimeoutExpired: Command '{args}' timed out after {timeout} seconds"
+        except asyncio.CancelledError:
+            raise
+        except Exception as e:
+            return None, f"[ERR] subprocess.Exception: {e}"
+
+    async def _communicate(self, proc: asyncio.subprocess.Process, stdin_prompt: str | None, encoding: str) -> tuple[bytes, bytes]:
+        # Like proc.communicate(), but the prompt is encoded and fed in chunks while stdout/stderr drain:
+        # the whole prompt never exists twice in memory and the CLI can start reading right away
+        async def feed() -> None:
+            if stdin_prompt is None or proc.stdin is None:
+                return
+            encoder = codecs.getincrementalencoder(encoding)()
+            try:
+                for i in range(0, len(stdin_prompt), _STDIN_CHUNK):
+                    proc.stdin.write(encoder.encode(stdin_prompt[i:i + _STDIN_CHUNK]))
+                    await proc.stdin.drain()  # Backpressure: wait while the pipe is full
+                proc.stdin.write(encoder.encode('', final=True))
+                await proc.stdin.drain()
+            except (BrokenPipeError, ConnectionResetError):
+                pass  # The CLI exited early; its return code and stderr report why
+            finally:
+                proc.stdin.close()
+
+        assert proc.stdout is not None and proc.stderr is not None
+        stdout, stderr, _ = await asyncio.gather(proc.stdout.read(), proc.stderr.read(), feed())
+        await proc.wait()
+        return stdout, stderr
+
+    def _result(self, returncode: int | None, stdout: str, stderr: str) -> tuple[Any, str | None]:
+        # Shared post-processing for exec/aexec: check the exit status, then extract the JSON payload
+        if returncode != 0:
+            # Capture first 2000 chars of stderr to preserve diagnostic information
+            stderr_msg = stderr[:2000] if stderr else "no stderr"
+            return None, f"[ERR] subprocess.run: returncode={returncode}, stderr: {stderr_msg}"
+
+        self._dump('stdout.txt', stdout)
+
+        # Two-stage JSON extraction for resilience against varied AI output formats:
+        # Primary: subclass-specific parser → Fallback: direct fenced JSON extraction
+        payload, err = self._parse_stdout(stdout)
+        if payload is None: # Fallback: extract fenced JSON directly from stdout, then parse
+            print("[WARNING] exec: Fallback to find fenced payload")
+            payload = self._strip_fence(stdout)
+            if payload is None:
+                return None, err
+
+        data, err = self._extract_json(payload)
+        if data is None:
+            return None, err
+
+        return data, None
+
     def _dump(self, fn: str, text: str) -> bool:
         # Write debug output to tmp directory if configured; return False on any failure
         # NOTE: Silently ignores I/O errors (disk full, permission denied) to prioritize robustness
@@ -40,6 +40,12 @@ class AI2JSON(ABC):
         # Returns: (parsed JSON object (expected to be dict), error message or None on success)
         pass
 
+    @abstractmethod
+    async def aexec(self, args: list[str], timeout: int, stdin_prompt: str | None = None) -> tuple[Any, str | None]:
+        # Async variant of exec for event-loop callers; cancelling the awaiting task terminates the CLI subprocess
+        # Returns: same as exec
+        pass
+
     @staticmethod
     def create(ai: str, tmp: str | None = None) -> "AI2JSON":
         # Factory method: create concrete AI implementation via delayed imports to avoid circular dependencies
@@ -42,6 +42,12 @@ class Parser(ABC):
         # Implementers must honor block comment insertion when block=True for consistency with block_comment().
         pass
 
+    @abstractmethod
+    def insert_comments(self, source: str, comments: list[tuple[int, str, str, bool]]) -> str:
+        # Insert several (line, comment, tag, block) comments in one pass over the source.
+        # Result must equal applying insert_comment() for each entry in order.
+        pass
+
     @abstractmethod
     def block_comment(self, comment: str, tag = '') -> str:
         # Return a block comment string.
@@ -59,6 +65,12 @@ class Parser(ABC):
         # Supports only full-line line comments (no block or inline trailing comments).
         pass
 
+    @abstractmethod
+    def extract_comments_many(self, source: str, tags: tuple[str, ...]) -> tuple[list[list[str]], str]:
+        # Extract comments for several tags in one pass and return (comment_lists_per_tag, source_without_comments).
+        # Result must equal calling extract_comments() for each tag in order on the residual source.
+        pass
+
     # Use function-scoped imports to avoid circular dependencies.
     @staticmethod
     def parsers() -> dict[str, "Parser"]:
@@ -126,6 +126,24 @@ class TheParser(Parser):
         lines.insert(line, comment)
         return '\n'.join(lines) # Uniformly use '\n' and remove trailing newline, caller must handle their own needs
 
+    def insert_comments(self, source: str, comments: list[tuple[int, str, str, bool]]) -> str:
+        # Split and join once instead of once per comment; each entry sees the lines inserted by the previous ones
+        if not comments:
+            return source  # No insert_comment() call to make, so nothing to normalize either
+        lines = source.splitlines()
+        for i, (line, comment, tag, block) in enumerate(comments):
+            text = self.block_comment(comment, tag) if block else self.line_comment(comment, tag)
+            if text is None:
+                raise ValueError("Comment is not supported")
+            if i > 0 and lines and lines[-1] == '':
+                lines.pop()  # Joining and re-splitting the previous result would drop one trailing empty line
+            n = len(lines)
+            if line < 0:
+                line += n
+            line = max(0, min(line, n))  # Allow insertion at end
+            lines[line:line] = (text + '\n').splitlines()  # Same line split a re-parse of the joined source would give
+        return '\n'.join(lines) # Uniformly use '\n' and remove trailing newline, caller must handle their own needs
+
     def block_comment(self, comment: str, tag = '', force = False) -> str | None:
         # Can be overridden by specific language implementations if needed
         prefix = self._block_comment_prefix()
@@ -177,6 +195,32 @@ class TheParser(Parser):
         kept.extend(lines[next:])
         return comments, '\n'.join(kept) # Uniformly use '\n' and remove trailing newline, caller must handle their own needs
 
+    def extract_comments_many(self, source: str, tags: tuple[str, ...]) -> tuple[list[list[str]], str]:
+        # One scan for all tags; a line belongs to the first tag that matches, as with sequential extraction
+        lines = source.splitlines()
+        comments: list[list[str]] = [[] for _ in tags]
+        owner: list[int] = []  # Index of the matching tag per line, len(tags) when kept
+        for line in lines:
+            stripped = line.strip()
+            for k, tag in enumerate(tags):
+                comment = self._extract_line_comment(stripped, tag)
+                if comment is not None:
+                    comments[k].append(comment)
+                    owner.append(k)
+                    break
+            else:
+                owner.append(len(tags))
+
+        # Each intermediate join/split of sequential extraction drops one trailing empty line of that stage
+        for k in range(len(tags) - 1):
+            i = len(owner) - 1
+            while i >= 0 and owner[i] <= k:
+                i -= 1
+            if i >= 0 and lines[i] == '':
+                owner[i] = -1
+        kept = [line for line, k in zip(lines, owner) if k == len(tags)]
+        return comments, '\n'.join(kept) # Uniformly use '\n' and remove trailing newline, caller must handle their own needs
+
     def _extract_line_comment(self, line: str, tag: str) -> str | None:
         # Only match full-line comments (starting at column 0 after strip); multi-line content generated by block_comment() remains unchanged
         # Tags requiring leading space should include it themselves (e.g., ' Author:')
@@ -38,8 +38,23 @@ class Reviewer(ABC):
         stdin_prompt: str | None = None,
         parser: Parser | None = None,
         expected: str | None = None,
+        expected_source: str | None = None,
     ) -> tuple[Any, str | None]:
         # Execute the AI review run and validate the structured response.
+        # expected_source: the source behind 'expected'; an identical output skips AST parsing.
+        pass
+
+    @abstractmethod
+    async def aexec(
+        self,
+        args: list[str],
+        timeout: int,
+        stdin_prompt: str | None = None,
+        parser: Parser | None = None,
+        expected: str | None = None,
+        expected_source: str | None = None,
+    ) -> tuple[Any, str | None]:
+        # Async variant of exec; cancelling the awaiting task terminates the underlying AI process.
         pass
 
     @staticmethod
@@ -53,7 +68,7 @@ class ReviewFile(ABC):
     # File-level reviewer responsible for generating inline review artifacts.
 
     @abstractmethod
-    def review(self, reviewer: Reviewer, src_path: str, references: list[str], context = '', lang = '', timeout=0, retry = 1, tmp: str | None = None) -> str | None:
+    def review(self, reviewer: Reviewer, src_path: str, references: list[str], context: str = '', lang: str = '', timeout: int = 0, retry: int = 1, tmp: str | None = None) -> str | None:
         # Pipeline: load source -> invoke AI review (with retries) -> validate AST -> emit inline annotations.
         # references: supplemental files forwarded to the reviewer.
         # context: optional metadata shared with the AI prompt.
@@ -63,6 +78,11 @@ class ReviewFile(ABC):
         # tmp: scratch file for persisting review-time errors.
         pass
 
+    @abstractmethod
+    async def areview(self, reviewer: Reviewer, src_path: str, references: list[str], context: str = '', lang: str = '', timeout: int = 0, retry: int = 1, tmp: str | None = None) -> str | None:
+        # Async variant of review; AI calls go through Reviewer.aexec so many files can share one event loop.
+        pass
+
     @staticmethod
     def create() -> "ReviewFile":
         # Factory helper that prevents circular imports.
@@ -80,7 +100,7 @@ class ReviewProject(ABC):
     # Project-level reviewer that assembles and emits the aggregated .REVIEW.md report.
 
     @abstractmethod
-    def review(self, reviewer: Reviewer, path: str, reviews: dict[str, str], folders: list[str], references: list[str], context = '', lang = '', timeout=0) -> str | None:
+    def review(self, reviewer: Reviewer, path: str, reviews: dict[str, str], folders: list[str], references: list[str], context: str = '', lang: str = '', timeout: int = 0) -> str | None:
         # Entry point: load consolidated results, run project-scale AI review, and refresh .REVIEW.md.
         # reviews: mapping of file names to their inline review output.
         # folders: module directories whose .REVIEW.md summaries are incorporated.
@@ -95,6 +115,11 @@ class ReviewProject(ABC):
         # Extract inline review annotations (marked with %%) and return the concatenated text or None if absent.
         pass
 
+    @abstractmethod
+    def extract_reviews(self, src_paths: list[str]) -> dict[str, str | None]:
+        # Bulk extract_review across files concurrently; returns a mapping: file -> extracted review or None.
+        pass
+
     @staticmethod
     def create() -> "ReviewProject":
         # Factory helper that prevents circular imports.
@@ -0,0 +1,159 @@
+import os
+import json
+import time
+import sqlite3
+import hashlib
+import functools
+import threading
+from typing import Any
+from collections import OrderedDict
+from ..codeparser.index import Parser
+
+# Process-wide AST cache keyed by (parser class, SHA-256 of source); retries and re-reviews often re-parse identical text
+_AST_CACHE: "OrderedDict[tuple[type, bytes], str]" = OrderedDict()
+_AST_CACHE_SIZE = 128
+_AST_LOCK = threading.Lock()  # Parallel reviews share the cache
+
+# On-disk cache under tmp: one-shot CLI runs reuse the parses of unchanged files, and the AI responses to identical prompts, across invocations
+_CACHE_DB: dict[str, sqlite3.Connection | None] = {}
+_CACHE_DB_NAME = 'cache.sqlite'
+_CACHE_SCHEMA = '2'  # Bumped when a table layout changes; older tables are dropped on open
+_CACHE_MAX_ROWS = 2048  # Per table, least recently used rows go first
+_CACHE_MAX_AGE = 30 * 86400  # Seconds since last use
+
+
+def source_digest(source: str) -> bytes:
+    return hashlib.sha256(source.encode('utf-8')).digest()
+
+
+@functools.lru_cache(maxsize=1)
+def _grammar_version() -> str:
+    # Parse output depends on the tree-sitter runtime and grammar bundle; a version change invalidates stored ASTs
+    from importlib.metadata import version, PackageNotFoundError
+    versions = []
+    for dist in ('tree_sitter', 'tree_sitter_languages'):
+        try:
+            versions.append(version(dist))
+        except PackageNotFoundError:
+            versions.append('')
+    return '/'.join(versions)
+
+
+def _cache_db(tmp: str) -> sqlite3.Connection | None:
+    # Open (once per tmp folder) the persistent AST and response tables; callers hold _AST_LOCK
+    if tmp in _CACHE_DB:
+        return _CACHE_DB[tmp]
+    db = None
+    try:
+        os.makedirs(tmp, exist_ok=True)
+        db = sqlite3.connect(os.path.join(tmp, _CACHE_DB_NAME), check_same_thread=False, isolation_level=None)
+        db.execute('PRAGMA journal_mode=WAL')
+        db.execute('PRAGMA synchronous=NORMAL')
+        db.execute('CREATE TABLE IF NOT EXISTS meta(name TEXT PRIMARY KEY, value TEXT)')
+        row = db.execute("SELECT value FROM meta WHERE name = 'schema'").fetchone()
+        if row is None or row[0] != _CACHE_SCHEMA:
+            db.execute('DROP TABLE IF EXISTS ast')
+            db.execute('DROP TABLE IF EXISTS responses')
+            db.execute("INSERT OR REPLACE INTO meta VALUES ('schema', ?)", (_CACHE_SCHEMA,))
+        # accessed: epoch second of the last store or hit, for age and LRU pruning; stamp: review time of the stored response
+        db.execute('CREATE TABLE IF NOT EXISTS ast(key BLOB PRIMARY KEY, logic TEXT, accessed INTEGER)')
+        db.execute('CREATE TABLE IF NOT EXISTS responses(key BLOB PRIMARY KEY, data TEXT, stamp TEXT, accessed INTEGER)')
+        row = db.execute("SELECT value FROM meta WHERE name = 'grammar'").fetchone()
+        if row is None or row[0] != _grammar_version():
+            db.execute('DELETE FROM ast')
+            db.execute("INSERT OR REPLACE INTO meta VALUES ('grammar', ?)", (_grammar_version(),))
+        now = int(time.time())
+        for table in ('ast', 'responses'):
+            db.execute(f'CREATE INDEX IF NOT EXISTS {table}_accessed ON {table}(accessed)')
+            db.execute(f'DELETE FROM {table} WHERE accessed < ?', (now - _CACHE_MAX_AGE,))
+            db.execute(f'DELETE FROM {table} WHERE key NOT IN (SELECT key FROM {table} ORDER BY accessed DESC LIMIT ?)', (_CACHE_MAX_ROWS,))
+    except sqlite3.Error as e:
+        print(f"[WARNING] Cache disabled: {e}")
+        if db is not None:
+            db.close()
+        db = None  # Cache is an optimization only; fall back to in-memory
+    _CACHE_DB[tmp] = db
+    return db
+
+
+def parse_cached(parser: Parser, source: str, tmp: str | None = None) -> str:
+    # Return parser.parse(source), reusing the result for byte-identical sources (LRU bounded, plus SQLite under tmp)
+    key = (type(parser), source_digest(source))
+    db_key = f'{key[0].__module__}.{key[0].__qualname__}\0'.encode('utf-8') + key[1]
+    with _AST_LOCK:
+        logic: str | None = _AST_CACHE.get(key)
+        if logic is not None:
+            _AST_CACHE.move_to_end(key)
+            return logic
+        db = _cache_db(tmp) if tmp else None
+        if db is not None:
+            try:
+                row = db.execute('SELECT logic FROM ast WHERE key = ?', (db_key,)).fetchone()
+                if row is not None:
+                    db.execute('UPDATE ast SET accessed = ? WHERE key = ?', (int(time.time()), db_key))
+            except sqlite3.Error:
+                row = None
+            if row is not None:
+                logic = row[0]
+    if logic is None:
+        logic = parser.parse(source)  # Parse outside the lock so parallel reviews don't serialize on tree-sitter
+        if db is not None:
+            with _AST_LOCK:
+                try:
+                    db.execute('INSERT OR REPLACE INTO ast VALUES (?, ?, ?)', (db_key, logic, int(time.time())))
+                except sqlite3.Error:
+                    pass
+    with _AST_LOCK:
+        _AST_CACHE[key] = logic
+        if len(_AST_CACHE) > _AST_CACHE_SIZE:
+            _AST_CACHE.popitem(last=False)
+    return logic
+
+
+def response_key(args: list[str], stdin_prompt: str | None) -> bytes:
+    # SHA-256 of the exact CLI invocation: same executable, system prompt, language and request JSON (including the prior review)
+    h = hashlib.sha256()
+    for arg in args:
+        h.update(arg.encode('utf-8', 'surrogatepass'))
+        h.update(b'\0')
+    if stdin_prompt is not None:
+        h.update(b'\1')
+        h.update(stdin_prompt.encode('utf-8', 'surrogatepass'))
+    return h.digest()
+
+
+def cached_response(tmp: str | None, key: bytes) -> tuple[Any, str] | None:
+    # (validated AI response, its original review timestamp) previously stored for this exact invocation, or None
+    if not tmp:
+        return None
+    with _AST_LOCK:
+        db = _cache_db(tmp)
+        if db is None:
+            return None
+        try:
+            row = db.execute('SELECT data, stamp FROM responses WHERE key = ?', (key,)).fetchone()
+            if row is not None:
+                db.execute('UPDATE responses SET accessed = ? WHERE key = ?', (int(time.time()), key))
+        except sqlite3.Error:
+            return None
+    if row is None:
+        return None
+    try:
+        return json.loads(row[0]), row[1]
+    except ValueError:
+        return None  # Corrupted entry: treat as a miss; the next store overwrites it
+
+
+def store_response(tmp: str | None, key: bytes, data: Any, stamp: str) -> None:
+    # Remember a validated AI response and when it was produced, so an identical invocation can skip the AI call
+    if not tmp:
+        return
+    text = json.dumps(data, ensure_ascii=False)
+    with _AST_LOCK:
+        db = _cache_db(tmp)
+        if db is None:
+            return
+        try:
+            db.execute('INSERT OR REPLACE INTO responses VALUES (?, ?, ?, ?)', (key, text, stamp, int(time.time())))
+        except sqlite3.Error:
+            pass
\ No newline at end of file
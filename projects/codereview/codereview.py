@@ -9,13 +9,16 @@
 #\/ ----------
 
 import os
+import sys
 import json
-from git import Repo
+import asyncio
+import subprocess
+from typing import Any, Iterator
 from pathlib import Path
-from concurrent.futures import ThreadPoolExecutor
 from ..codeparser.index import Parser
 from .architecture import Reviewer, ReviewFile, ReviewProject
 from .index import Codereview
+from .util import resolve, run_sync
 
 class TheCodereview(Codereview):
     def __init__(self, ai: str, context = '', timeout=0, lang = '', tmp: str | None = None):
@@ -28,66 +31,155 @@ class TheCodereview(Codereview):
         self.timeout = timeout
         self.lang = lang
         self.tmp = tmp
+        # Context-only JSON is invariant for the instance; reuse it whenever the git diff is empty
+        self._context_json = json.dumps({'context': context}, indent=2, ensure_ascii=False) if context != '' else ''
         # Supported extensions for filtering reviewable files
         self.extensions = tuple(Parser.ext2parser().keys())
+        # Reference lists keyed by resolved directory and its spelling; sibling files share the same glob result
+        self._refs_cache: dict[tuple[str, str], list[str]] = {}
+        # Extracted reviews keyed by file path and stamped with (mtime_ns, size); persisted under tmp when provided
+        self._review_cache_path = Path(tmp) / '.review_cache.json' if tmp else None
+        self._review_cache: dict[str, Any] = self._load_review_cache()
 
     def _collect_references(self, project: str) -> list[str]:
+        # The resolved directory keeps a relative spelling from going stale after os.chdir; the spelling itself stays in the key
+        # because the returned paths are built from it
+        key = (resolve(project), project)
+        cached = self._refs_cache.get(key)
+        if cached is not None:
+            return list(cached)  # Hand out a copy so callers can't mutate the cached entry
+
         # Ensure the directory string ends with a slash so glob stays scoped
         if project != '' and not project.endswith('/'):
             project += '/'
 
         references = [str(f) for f in Path(project).glob('*.md') if not f.name.endswith('.REVIEW.md')] # Avoid context polution from outdated review file
-        return references
+        self._refs_cache[key] = references
+        return list(references)
+
+    def _load_review_cache(self) -> dict[str, Any]:
+        if self._review_cache_path is None:
+            return {}
+        try:
+            cache = json.loads(self._review_cache_path.read_text(encoding="utf-8"))
+            return cache if isinstance(cache, dict) else {}
+        except Exception:
+            return {}  # Missing or corrupted cache simply means a cold start
+
+    def _save_review_cache(self, folder: str, files: list[str]) -> None:
+        # files: the complete scan of folder; its other cached entries are gone or no longer reviewable, so they are dropped
+        # (string checks only, no stat per entry) and the cache cannot grow without bound
+        if self._review_cache_path is None:
+            return
+        scanned = set(files)
+        self._review_cache = {file: entry for file, entry in self._review_cache.items() if file in scanned or os.path.dirname(file) != folder}
+        try:
+            self._review_cache_path.parent.mkdir(parents=True, exist_ok=True)
+            self._review_cache_path.write_text(json.dumps(self._review_cache, ensure_ascii=False), encoding="utf-8")
+        except OSError:
+            pass  # Cache is an optimization only; never fail the review because of it
+
+    def _extract_reviews(self, files: list[str]) -> dict[str, str | None]:
+        # Skip reparsing files whose mtime and size still match the cached stamp; extract the rest in bulk
+        results: dict[str, str | None] = {}
+        stale: dict[str, list[int] | None] = {}
+        for file in files:
+            try:
+                st = os.stat(file)
+            except OSError:
+                stale[file] = None  # Let the extractor surface the error
+                continue
+            stamp = [st.st_mtime_ns, st.st_size]
+            entry = self._review_cache.get(file)
+            if isinstance(entry, dict) and entry.get('stamp') == stamp:
+                results[file] = entry.get('review')
+            else:
+                stale[file] = stamp
+
+        extracted = self.project.extract_reviews(list(stale))
+        for file, new_stamp in stale.items():
+            review = extracted[file]
+            if new_stamp is not None:
+                self._review_cache[file] = {'stamp': new_stamp, 'review': review}
+            results[file] = review
+        return results
+
+    def _repo(self, path: str) -> Any:
+        # Repository containing path, searched up to its root
+        from git import Repo  # Deferred: GitPython import cost is only paid by git-aware flows
+        return Repo(path, search_parent_directories=True)
 
     def _git_diff(self, src_path: str) -> str:
         # Get repository diff for the target file relative to the working tree
         try:
-            src = Path(src_path).resolve()  # Convert to absolute path
-            repo = Repo(src.parent, search_parent_directories=True)  # Search up to repo root
+            src = Path(resolve(src_path))  # Convert to absolute path
+            repo = self._repo(str(src.parent))
             src = src.relative_to(repo.working_dir)  # Normalize to repo-relative path
-            return repo.git.diff("--", str(src))
+            return self._git(repo.working_dir, "diff", "--", str(src))
         except Exception:
             return ''  # VERIFIED! Return empty diff so callers can continue without diff context.
 
+    def _git(self, repo_root: str, *args: str) -> str:
+        # Direct git invocation; GitPython's command proxying is heavy for these hot, simple calls
+        return subprocess.run(["git", "-C", repo_root, *args], capture_output=True, text=True, encoding="utf-8", check=True).stdout
+
+    def _git_stream(self, repo_root: str, *args: str) -> Iterator[str]:
+        # Iterate `git diff` output line by line from the pipe instead of buffering the whole stdout
+        cmd = ["git", "-C", repo_root, "diff", *args]
+        with subprocess.Popen(cmd, stdout=subprocess.PIPE, stderr=subprocess.DEVNULL, text=True, encoding="utf-8") as proc:
+            assert proc.stdout is not None
+            for line in proc.stdout:
+                line = line.rstrip('\r\n')
+                if line != '':
+                    yield line
+        if proc.returncode != 0:
+            raise subprocess.CalledProcessError(proc.returncode, cmd)
+
+    def _git_changed(self, repo_root: str, *args: str) -> Iterator[str]:
+        # Paths whose content changed: added, modified, and renamed-with-edits targets.
+        # Deletions and type changes carry nothing to review, and a 100%-similar rename (R100) leaves the text, reviews included, unchanged.
+        for line in self._git_stream(repo_root, *args, "--name-status", "-M", "--diff-filter=AMR"):
+            status, _, paths = line.partition('\t')
+            if status != 'R100':
+                yield paths.rpartition('\t')[2]  # Renames list "old<TAB>new"; keep the new path
+
     def _git_modified(self, path: str) -> list[str]:
         # Collect modified, staged, or untracked files within the git repository
         try:
             path = self._path(path)  # Normalize to an absolute directory path
-            repo = Repo(path, search_parent_directories=True)  # Search up to repo root
+            repo = self._repo(path)
+            root = str(repo.working_tree_dir)
+            relative: dict[str, None] = {}  # Ordered set: deduplicates all three sources in a single pass
             try:
-                modified = repo.git.diff("HEAD", "--name-only", "--diff-filter=d").splitlines()  # Modified files, excluding deletions
+                modified = dict.fromkeys(self._git_changed(root, "HEAD"))  # Added or modified files
             except Exception: # Repo has no commits yet
-                modified = []
-            staged   = repo.git.diff("--cached", "--name-only", "--diff-filter=d").splitlines()  # Staged files, excluding deletions
-            untracked = repo.untracked_files  # Untracked files
-            relative = list(dict.fromkeys(modified + staged + untracked))  # Deduplicate while preserving order
+                modified = {}
+            relative.update(modified)
+            relative.update(dict.fromkeys(self._git_changed(root, "--cached")))  # Staged added or modified files
+            relative.update(dict.fromkeys(repo.untracked_files))  # Untracked files
             # Convert to absolute paths
-            repo_root = Path(repo.working_tree_dir)
+            repo_root = Path(root)
             return [str(repo_root / f) for f in relative]
         except Exception as e:
             raise ValueError(f"Failed to get git modified files: {e}") from e
     
     def _path(self, path: str) -> str:
         # Return directory path for files or normalize already-directory inputs
-        p = Path(path).resolve()
+        p = Path(resolve(path))
         return str(p) if p.is_dir() else str(p.parent)
 
     def _paths(self, files: list[str]) -> list[str]:
-        # Extract unique directory paths from files and keep them ordered
-        paths = []
-        for file in files:
-            path = self._path(file)
-            if path not in paths:
-                paths.append(path)
+        # Extract unique directory paths from files; dict keys dedupe in O(n) while preserving order
+        paths = dict.fromkeys(self._path(file) for file in files)
 
         # Sort descending by length so child directories are processed before parents
         return sorted(paths, key=len, reverse=True)
     
-    def _diff(self, src_path: str) -> str:
-        ctx: dict[str, str] = {}
-        diff = self._git_diff(src_path)
-        if diff != '':
-            ctx['git-diff'] = diff
+    def _diff(self, diff: str) -> str:
+        # Wrap the git diff and the shared context into the JSON context string
+        if diff == '':
+            return self._context_json  # Common for files outside a repo: skip per-file encoding
+        ctx: dict[str, str] = {'git-diff': diff}
         if self.context != '':
             ctx['context'] = self.context
         return json.dumps(ctx, indent=2, ensure_ascii=False)
@@ -98,8 +190,16 @@ class TheCodereview(Codereview):
         if not src_path.lower().endswith(self.extensions):  # Check for supported extensions
             return None
 
+        return run_sync(self._areview_code(src_path, fix, git_diff))
+
+    async def _areview_code(self, src_path: str, fix: int = 0, git_diff: bool = False) -> str | None:
+        # Async body of review_code; the AI call awaits on the event loop so files can be reviewed concurrently
         project = str(Path(src_path).parent)  # Pathlib normalizes separators so Windows lookups stay correct.
-        references = self._collect_references(project)
+        # Overlap the reference glob with the git subprocess; results are only needed once the context is built
+        references_future = asyncio.ensure_future(asyncio.to_thread(self._collect_references, project))
+        diff = await asyncio.to_thread(self._git_diff, src_path) if git_diff else None
+        references = await references_future
+        context = self._diff(diff) if diff is not None else self.context
 
         if fix > 0:
             reviewer = self.fixer
@@ -107,18 +207,28 @@ class TheCodereview(Codereview):
         else:
             reviewer = self.file
             retry = 1
+        return await reviewer.areview(self.reviewer, src_path, references, context, self.lang, self.timeout, retry, self.tmp)
+
+    async def _areview_list(self, files: list[str], workers: int, fix: int = 0, git_diff: bool = False) -> list[Any]:
+        # Review files concurrently on one event loop, with at most `workers` AI processes in flight
+        semaphore = asyncio.Semaphore(workers)
 
-        context = self._diff(src_path) if git_diff else self.context
-        return reviewer.review(self.reviewer, src_path, references, context, self.lang, self.timeout, retry, self.tmp)
+        async def review_one(file: str) -> str | None:
+            async with semaphore:
+                return await self._areview_code(file, fix, git_diff)
+
+        return await asyncio.gather(*(review_one(file) for file in files), return_exceptions=True)
 
     def review_list(self, files: list[str], parallel: bool = False, fix: int = 0, git_diff: bool = False) -> dict[str, str]:
         # Review a list of files and return a mapping: file -> review content
+        files = [f for f in files if f.lower().endswith(self.extensions)]  # Drop unsupported files before dispatching any work
         reviews = {}
         if parallel:
             workers = os.cpu_count() or 1  # Fallback to single worker when CPU count is unavailable.
-            with ThreadPoolExecutor(max_workers=workers) as executor:
-                futures = [executor.submit(self.review_code, file, fix, git_diff) for file in files]
-                results = [future.result() for future in futures]
+            results = run_sync(self._areview_list(files, workers, fix, git_diff))
+            for result in results:  # All reviews have settled; surface the first failure in file order
+                if isinstance(result, BaseException):
+                    raise result
             for file, review in zip(files, results):
                 if review is not None:
                     reviews[file] = review
@@ -131,7 +241,7 @@ class TheCodereview(Codereview):
 
     def review_path(self, path: str, synthesize: bool = False, parallel: bool = False, fix: int = 0) -> int:
         # Review all supported files located directly under the provided path
-        files = [str(f) for f in Path(path).resolve().glob('*.*')]
+        files = [str(f) for f in Path(resolve(path)).glob('*.*')]
         n = len(self.review_list(files, parallel, fix))  # Run file-level reviews on all sources
         if synthesize:  # Optionally generate or update .REVIEW.md for the directory
             self.review_proj(path, parallel, fix)
@@ -149,7 +259,7 @@ class TheCodereview(Codereview):
 
     def review_proj(self, path: str, parallel: bool = False, fix: int = 0) -> str | None:
         # Generate a project-level review report (.REVIEW.md)
-        path_obj = Path(path).resolve()
+        path_obj = Path(resolve(path))
         if path_obj.exists() and path_obj.is_dir():
             dir_path = path_obj
             md_path = dir_path / '.REVIEW.md'
@@ -161,29 +271,39 @@ class TheCodereview(Codereview):
         project = str(dir_path).replace('\\\\', '/')  # Flatten heavily escaped separators before collecting references
         references = self._collect_references(project)
 
-        # Include only top-level files whose extensions map to known parsers
-        files = [str(f) for f in dir_path.glob('*.*') if f.is_file()]
-        # Include only first-level subdirectories and skip dot-prefixed directories
-        folders = [str(f) for f in dir_path.glob('*/') if not f.name.startswith('.')]
+        # Single directory pass: DirEntry carries the file/dir type, so no extra stat per entry
+        files = []
+        folders = []
+        with os.scandir(dir_path) as entries:
+            for entry in entries:
+                if entry.is_file():
+                    # Include only top-level files whose extensions map to known parsers
+                    # Lowercase ensures cached reviews are picked up even when filesystem reports uppercase suffixes.
+                    if entry.name.lower().endswith(self.extensions):
+                        files.append(entry.path)
+                elif entry.is_dir() and not entry.name.startswith('.'):
+                    # Include only first-level subdirectories and skip dot-prefixed directories
+                    folders.append(entry.path)
 
         reviews = {}
         to_review = []
         md_path_str = str(md_path)
-        exts = tuple(Parser.ext2parser().keys())
         codefix = fix > 0
         reviewed = 'fixed' if codefix else 'reviewed'
+        existing = self._extract_reviews(files)  # Pull existing reviews if available
+        status = []  # One status line per file, written in a single call instead of a print per file
         for file in files:
-            # Lowercase ensures cached reviews are picked up even when filesystem reports uppercase suffixes.
-            if not file.lower().endswith(exts):  # Process only supported languages
-                continue
-            review = self.project.extract_review(file)  # Pull existing review if available
+            review = existing[file]
             if review and '---------- [Review]' in review and not (codefix and '---------- [Issues]' in review):
-                print(f'{file} already {reviewed}')
+                status.append(f'{file} already {reviewed}\n')
                 reviews[file] = review
             else:
-                print(f'{file} not {reviewed}')
+                status.append(f'{file} not {reviewed}\n')
                 to_review.append(file)
 
-        print(f'--- {len(to_review)} to be {reviewed} ...')
+        self._save_review_cache(str(dir_path), files)
+        status.append(f'--- {len(to_review)} to be {reviewed} ...\n')
+        sys.stdout.write(''.join(status))
+        sys.stdout.flush()  # Show the plan before the long-running reviews start
         reviews.update(self.review_list(to_review, parallel, fix)) # Add newly reviewed files
         return self.project.review(self.reviewer, md_path_str, reviews, folders, references, self.context, self.lang, self.timeout)
\ No newline at end of file
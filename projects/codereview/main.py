@@ -15,15 +15,17 @@
 #% pip install git+https://github.com/zen3301/tokenn.git#subdirectory=projects/codereview
 
 import argparse
+import functools
 from pathlib import Path
 from .index import Codereview
 
 
-def main(argv: list[str]) -> int:
-    # Parse CLI arguments.
+@functools.lru_cache(maxsize=1)
+def _build_parser() -> argparse.ArgumentParser:
+    # Build the CLI parser once; repeated programmatic calls to main() reuse it.
     parser = argparse.ArgumentParser(description="Code review.")
     parser.add_argument("--ai", choices=["codex", "claude"], required=True, help="AI cli to use for review.")
-    parser.add_argument("--path", "-p", type=str, required=True, help="Path to review.")
+    parser.add_argument("--path", "-p", type=Path, required=True, help="Path to review.")
     parser.add_argument("--modified", "-m", action="store_true", help="Review git modified files only.")
     parser.add_argument("--synthesize", "-s", action="store_true", help="Synthesize .REVIEW.md for the path.")
     parser.add_argument("--context", "-c", type=str, default='', help="Additional context for review.")
@@ -32,10 +34,20 @@ def main(argv: list[str]) -> int:
     parser.add_argument("--lang", "-l", type=str, default='', help="Language for review.")
     parser.add_argument("--tmp", "-d", type=str, help="Temporary directory to dump logs.")
     parser.add_argument("--parallel", action="store_true", help="Enable parallel review.")
+    return parser
+
+
+def main(argv: list[str]) -> int:
+    # Parse CLI arguments.
+    parser = _build_parser()
     args = parser.parse_args(argv)
+    target_path: Path = args.path
+    # Fail fast on a missing path; -m only locates the enclosing repository and -s creates a missing .REVIEW.md
+    if not args.modified and not target_path.exists() and not (args.synthesize and target_path.name == '.REVIEW.md'):
+        parser.error(f"argument --path/-p: path not found: {target_path}")
 
     review = Codereview.create(args.ai, args.context, args.timeout, args.lang, args.tmp)
-    target_path = Path(args.path)
+    path = str(target_path)
 
     # Four operating modes in descending priority:
     # 1. Git modified mode (-m): scan every tracked change in the repository
@@ -43,22 +55,22 @@ def main(argv: list[str]) -> int:
     # 3. Directory mode (-p is a directory): review top-level entries without recursion
     # 4. Single-file mode (-p is file without -s): review the specified file
     if args.modified:  # -m -p projects/ [-s]
-        count = review.review_modified(args.path, args.synthesize, args.parallel, args.fix)
+        count = review.review_modified(path, args.synthesize, args.parallel, args.fix)
         # Non-negative counts represent successful runs, including legitimate no-op scans.
         return 0 if count >= 0 else -1
 
     elif args.synthesize:  # -p projects/.REVIEW.md -s or -p projects/ -s
-        result = review.review_proj(args.path, args.parallel, args.fix)
+        result = review.review_proj(path, args.parallel, args.fix)
         # review_proj returns None on failure; empty strings are valid no-op outputs.
         return 0 if result is not None else -1
 
     elif target_path.is_dir():  # -p projects/
-        count = review.review_path(args.path, args.synthesize, args.parallel, args.fix)
+        count = review.review_path(path, args.synthesize, args.parallel, args.fix)
         # Directory reviews yield non-negative counts even when no actionable files exist.
         return 0 if count >= 0 else -1
 
     else:  # -p projects/a.py
-        result = review.review_code(args.path, args.fix)
+        result = review.review_code(path, args.fix)
         # review_code uses None to indicate failure; empty strings reflect comment-only sources.
         return 0 if result is not None else -1
 
@@ -8,38 +8,88 @@
 #\/ Language preference now uses the explicit override end-to-end while falling back to stored metadata when absent.
 #\/ ----------
 
+import os
+import re
 import time
-from typing import Any
+import atexit
+import asyncio
+import weakref
+import threading
+from typing import Any, TextIO, TypedDict
 from pathlib import Path
 from ..codeparser.index import Parser
 from .architecture import ReviewFile, Reviewer
+from .cache import cached_response, parse_cached, response_key, store_response
+from .util import read_text, resolve, run_sync, timestamp, write_text
+
+# Ordinal suffix by the last two digits; teens always take 'th' (11th, 111th, etc.)
+_ORDINAL = tuple('th' if 11 <= n <= 13 else {1: 'st', 2: 'nd', 3: 'rd'}.get(n % 10, 'th') for n in range(100))
+
+# First '$lang:' line and its leading word; an empty directive falls back to English
+_LANG_RE = re.compile(r'(?m)^\$lang:[ \t]*(\S*)')
+
+# File review request as sent to the AI. A TypedDict rather than a dataclass: it is serialized verbatim into the prompt.
+class ReviewRequest(TypedDict):
+    path: str
+    references: list[str]
+    comment_language: str
+    prior_review: str
+    requirements: str
+    context: str
+    input: str
+
+# Instances with cached retry-log handles; weak so that registering for exit does not keep them alive
+_INSTANCES: "weakref.WeakSet[TheReviewFile]" = weakref.WeakSet()
+
+@atexit.register
+def _close_all() -> None:
+    for instance in list(_INSTANCES):
+        instance.close()
 
 class TheReviewFile(ReviewFile):
-    def _load(self, parser: Parser, src_path: str, references: list[str], context: str) -> Any:
+    # Review sections in output order: (data key, precomputed header, value is a string list)
+    _SECTIONS = tuple((t.lower(), f'---------- [{t}]\n', is_list) for t, is_list in (
+        ('Overview', False), ('Review', False), ('Design', False),
+        ('Notes', True), ('Issues', True), ('Imperfections', True), ('Impediments', True),
+    ))
+
+    def __init__(self) -> None:
+        # Retry logs stay open for the whole run: one open per log file instead of one per failed attempt
+        self._log_handles: dict[Path, TextIO] = {}
+        self._log_lock = threading.Lock()  # Parallel reviews may append concurrently
+        self._log_dirs: dict[str, Path] = {}  # tmp -> resolved and created log directory
+        self._cwd = os.getcwd()  # Refreshed at the start of every areview()
+        _INSTANCES.add(self)
+
+    def close(self) -> None:
+        # Flush and release the cached retry-log handles.
+        with self._log_lock:
+            for f in self._log_handles.values():
+                f.close()
+            self._log_handles.clear()
+
+    def _load(self, parser: Parser, src_path: str, references: list[str], context: str, src_code: str | None = None) -> ReviewRequest:
         # Build review request payload: compute relative path, read source, extract prior review comments, detect language preference.
-        path = Path(src_path).resolve().parent.relative_to(Path.cwd())
-        try:
-            src_code = Path(src_path).resolve().read_text(encoding="utf-8")
-        except Exception as e: # Source file must be in the current working directory
-            raise ValueError(f"Failed to read source file {src_path}: {e}") from e
-
-        # Extract review comments tagged with '\/' returning (comments, residual source).
-        reviews, source = parser.extract_comments(src_code, '\\/')
-        # Extract requirement comments tagged with '\%' returning (comments, residual source).
-        requirements, source = parser.extract_comments(source, '\\%')
+        # src_code: the file content when the caller just wrote it, which skips reading it back.
+        src = resolve(src_path)  # Resolve once; reused for the relative folder, the read and the write-back
+        path = os.path.relpath(os.path.dirname(src), self._cwd)  # String-level; no Path objects on the load path
+        if path == os.pardir or path.startswith(os.pardir + os.sep):
+            raise ValueError(f"{src!r} is not in the subpath of {self._cwd!r}")
+        if src_code is None:
+            try:
+                src_code = read_text(src)
+            except Exception as e: # Source file must be in the current working directory
+                raise ValueError(f"Failed to read source file {src_path}: {e}") from e
+
+        # Extract review comments tagged with '\/' and requirement comments tagged with '\%' in one pass, plus the residual source.
+        (reviews, requirements), source = parser.extract_comments_many(src_code, ('\\/', '\\%'))
 
         # Parse $lang: directive from historical review comments, defaulting to English.
-        comment_language = 'English'
-        lang = '$lang:'
-        for review in reviews:
-            if(review.startswith(lang)):
-                review = review[len(lang):].strip()
-                if review != '':
-                    comment_language = review.split(' ')[0]
-                break
+        m = _LANG_RE.search('\n'.join(reviews))
+        comment_language = m.group(1) or 'English' if m else 'English'
 
         return {
-            'path': str(path), # Folder only
+            'path': path, # Folder only
             'references': references,
             'comment_language': comment_language,
             'prior_review': '\n'.join(reviews),
@@ -48,85 +98,90 @@ class TheReviewFile(ReviewFile):
             'input': source.strip('\n'),
         }
 
-    def _comment_section(self, comment: str, title: str) -> str:
-        # Format a review section as '---------- [Title]\ncontent\n'.
-        return f'---------- [{title}]\n{comment}\n'
-    
-    def _coment_text(self, data: Any, key: str) -> str:
-        # Some reviewer outputs omit these sections; handle missing keys gracefully.
-        text = data.get(key.lower())
-        return '' if (not isinstance(text, str) or text == '') else self._comment_section(text, key)
-    
-    def _coment_list(self, data: Any, key: str) -> str:
-        text = '\n'.join([s for s in data.get(key.lower(), []) if isinstance(s, str) and s.strip() != '']).strip()
-        return '' if text == '' else self._comment_section(text, key)
-
-    def _update(self, ai: str, lang: str, parser: Parser, src_path: str, data: Any, requirements: str) -> str:
+    def _update(self, ai: str, lang: str, parser: Parser, src_path: str, data: Any, requirements: str, stamp: str | None = None) -> tuple[str, str]:
         # Assemble the review header, prepend it (and requirements, if any), then persist updated annotations.
-        txt = f"---------- Reviewed by: {ai} @ {time.strftime('%Y-%m-%d %H:%M:%S')}\n"
-        txt += '$lang: ' + lang + '\n'
-        txt += self._coment_text(data, 'Overview')
-        txt += self._coment_text(data, 'Review')
-        txt += self._coment_text(data, 'Design')
-        txt += self._coment_list(data, 'Notes')
-        txt += self._coment_list(data, 'Issues')
-        txt += self._coment_list(data, 'Imperfections')
-        txt += self._coment_list(data, 'Impediments')
-        txt += '----------\n'
+        # stamp: when the review was produced, defaulting to now. Returns (review text, written file content).
+        parts: list[str] = [
+            f"---------- Reviewed by: {ai} @ {stamp or timestamp()}\n",
+            '$lang: ' + lang + '\n',
+        ]
+        # Each non-empty section becomes '---------- [Title]\ncontent\n'; reviewer outputs may omit any of them.
+        for key, header, is_list in self._SECTIONS:
+            value = data.get(key)
+            if is_list:
+                value = '\n'.join([s for s in value or () if isinstance(s, str) and s and not s.isspace()]).strip()  # isspace() tests blankness without allocating a stripped copy
+            elif not isinstance(value, str):
+                continue
+            if value != '':
+                parts += (header, value, '\n')
+        parts.append('----------\n')
+        txt = ''.join(parts)  # Single join instead of a chain of string copies
 
         # Trim source code, avoid duplication of review/requirement comments
         source = data['output']
-        _, source = parser.extract_comments(source, '\\/')
-        _, source = parser.extract_comments(source, '\\%')
+        _, source = parser.extract_comments_many(source, ('\\/', '\\%'))
         source = source.strip('\n')
 
-        if requirements != '': # If requirement comments exist, write them back at the top of the source.
-            source = parser.insert_comment(source = source, line = 0, comment = requirements + '\n', tag = '\\%', block = False)
+        # Requirement comments (if any) go back at the top, then the review comments above them, in a single pass.
+        comments = [(0, requirements + '\n', '\\%', False)] if requirements != '' else []
+        comments.append((0, txt, '\\/', False))
+        source = parser.insert_comments(source, comments)
+        write_text(resolve(src_path), source)
+        return txt, source
 
-        # Insert the review comments at the top of the source.
-        source = parser.insert_comment(source = source, line = 0, comment = txt, tag = '\\/', block = False)
-        Path(src_path).resolve().write_text(source, encoding="utf-8")
-        return txt
-
-    def _error(self, i: int, path: str, data: Any, err: str | None, log: Path | None = None):
+    def _error(self, i: int, path: str, data: Any, err: str | None, log: Path | None = None) -> None:
         # Log a failed review attempt to stderr and optionally to the retry log.
         print(f"[WARNING] Failed the {self._th(i)} time to review {path}: {err}")
         if log:
-            with open(log, 'a', encoding='utf-8') as f:
-                f.write(f"#{i}: {err}\n")
-                if data and 'output' in data:
-                    # Persist AI-modified output to help debug failures.
-                    f.write("<<<\n")
-                    f.write(data['output'] + '\n')
-                    f.write(">>>\n")
+            text = f"#{i}: {err}\n"
+            if data and 'output' in data:
+                # Persist AI-modified output to help debug failures.
+                text += f"<<<\n{data['output']}\n>>>\n"
+            self._append(log, text)
+
+    def _append(self, log: Path, text: str) -> None:
+        # Append to a cached handle and flush so the log stays readable while the run continues.
+        with self._log_lock:
+            f = self._log_handles.get(log)
+            if f is None:
+                f = self._log_handles[log] = open(log, 'a', encoding='utf-8')
+            f.write(text)
+            f.flush()
     
     def _th(self, i: int) -> str:
-        d = i % 10 if (i % 100) // 10 != 1 else 0 # Avoid teen ordinals (11th, 111th, etc.)
-        th = 'st' if d == 1 else 'nd' if d == 2 else 'rd' if d == 3 else 'th'
-        return f"{i}{th}"
+        return f"{i}{_ORDINAL[i % 100]}"
 
     def _log(self, src_path: str, tmp: str | None = None) -> Path | None:
         # Determine error-log path when a temporary directory is provided.
         if tmp is None or tmp == '':
             return None
-        else:
-            fn = src_path.replace('\\', '/').split('/')[-1]
-            log = Path(tmp).resolve() / f'{fn}.log'
-            log.parent.mkdir(parents=True, exist_ok=True)
-            return log
-
-    def review(self, reviewer: Reviewer, src_path: str, references: list[str], context = '', lang = '', timeout=0, retry = 1, tmp: str | None = None) -> str | None:
+        log_dir = self._log_dirs.get(tmp)
+        if log_dir is None:  # Resolve and create the directory once per tmp instead of on every review
+            log_dir = Path(tmp).resolve()
+            log_dir.mkdir(parents=True, exist_ok=True)
+            self._log_dirs[tmp] = log_dir
+        fn = src_path.replace('\\', '/').rpartition('/')[2]  # Either separator, on any platform
+        return log_dir / f'{fn}.log'
+
+    def review(self, reviewer: Reviewer, src_path: str, references: list[str], context: str = '', lang: str = '', timeout: int = 0, retry: int = 1, tmp: str | None = None) -> str | None:
+        # Synchronous entry point over areview for callers without an event loop.
+        return run_sync(self.areview(reviewer, src_path, references, context, lang, timeout, retry, tmp))
+
+    async def areview(self, reviewer: Reviewer, src_path: str, references: list[str], context: str = '', lang: str = '', timeout: int = 0, retry: int = 1, tmp: str | None = None) -> str | None:
         # Primary review flow: load source, invoke AI reviewer with retries, AST-verify, then write back annotations.
+        self._cwd = os.getcwd()  # One getcwd per review; _load relativizes against it
         parser = Parser.create_by_filename(src_path)
         request = self._load(parser, src_path, references, context)
         if request['input'] == '':
             return ''
-        return self._review(request, parser, reviewer, src_path, lang, timeout, retry, tmp)
+        result = await self._review(request, parser, reviewer, src_path, lang, timeout, retry, tmp)
+        return result[0] if result else None
 
-    def _review(self, request: Any, parser: Parser, reviewer: Reviewer, src_path: str, lang = '', timeout=0, retry = 1, tmp: str | None = None) -> str | None:
+    async def _review(self, request: ReviewRequest, parser: Parser, reviewer: Reviewer, src_path: str, lang: str = '', timeout: int = 0, retry: int = 1, tmp: str | None = None) -> tuple[str, str] | None:
+        # Returns (review text, written file content), or None when no attempt produced a usable review.
         # Parse the AST to validate later that AI output preserves logic.
         source = request['input']
-        logic = parser.parse(source)
+        logic = parse_cached(parser, source, tmp)
 
         override_lang = (lang or '').strip()
         runtime_lang = override_lang or request['comment_language']  # Explicit overrides take precedence over stored metadata.
@@ -139,29 +194,58 @@ class TheReviewFile(ReviewFile):
         # Pull requirement comments for reinsertion later when present.
         requirements = request['requirements']
 
-        # Retry loop: attempt up to `retry` times, logging failures between attempts.
-        for i in range(retry):
-            # Compute ordinal suffix for human-friendly progress output.
-            th = '' if retry <= 1 else f"for the {self._th(i+1)} time "
-            print(f"Reviewing {src_path} {th}...")
-            t0 = time.time()
+        # An identical invocation (same code, prior review, context and prompt) already produced a validated review: reuse it.
+        key = response_key(args, stdin_prompt) if tmp else b''
+        cached = cached_response(tmp, key)
+        if cached is not None:
+            print(f"Reusing the cached review of {src_path}")
+            data, stamp = cached
+            return self._update(ai, runtime_lang, parser, src_path, data, requirements, stamp)  # Keep the original review time: no model ran now
+
+        if retry > 1:
+            # The CLI always passes retry=1 (the fixer loops on its own), so this serves programmatic callers only.
+            # Race all attempts concurrently: latency becomes the fastest valid attempt instead of the sum of failures.
+            data, err = await self._race(reviewer, src_path, retry, log, args=args, timeout=timeout, stdin_prompt=stdin_prompt, parser=parser, expected=logic, expected_source=source)
+        else:
+            print(f"Reviewing {src_path} ...")
+            t0 = time.perf_counter()  # Monotonic: wall-clock adjustments cannot skew the reported duration
             # Invoke reviewer and ensure AST validation holds before accepting output.
-            data, err = reviewer.exec(args=args, timeout=timeout, stdin_prompt=stdin_prompt, parser=parser, expected=logic)
-            dt = time.time() - t0
+            data, err = await reviewer.aexec(args=args, timeout=timeout, stdin_prompt=stdin_prompt, parser=parser, expected=logic, expected_source=source)
+            dt = time.perf_counter() - t0
             print(f"... Reviewed in {int(dt)}\" : {src_path}")
-            if data and not err:
-                # Successful review with AST match; persist annotations.
-                return self._update(ai, runtime_lang, parser, src_path, data, requirements)
-            else:
-                # Record the failure and continue retrying when allowed.
+            if not data or err:
+                self._error(1, src_path, data, err, log)
+
+        if data and not err:
+            # Successful review with AST match; persist annotations.
+            stamp = timestamp()
+            store_response(tmp, key, data, stamp)
+            return self._update(ai, runtime_lang, parser, src_path, data, requirements, stamp)
+        if data:
+            # Every attempt failed and the last one on AST mismatch: discard AI edits but keep metadata.
+            print(f"Let's ignore the modified inline comments, just update the review metadata.")
+            data['output'] = source
+            return self._update(ai, runtime_lang, parser, src_path, data, requirements)
+
+        return None
+
+    async def _race(self, reviewer: Reviewer, src_path: str, retry: int, log: Path | None, **kwargs: Any) -> tuple[Any, str | None]:
+        # Fire `retry` attempts at once; the first AST-valid result wins and the remaining attempts are cancelled.
+        # Returns the last completed attempt when none succeeds, mirroring the serial retry loop.
+        print(f"Reviewing {src_path} with {retry} concurrent attempts ...")
+        t0 = time.perf_counter()
+        tasks = [asyncio.ensure_future(reviewer.aexec(**kwargs)) for _ in range(retry)]
+        data, err = None, None
+        try:
+            for i, attempt in enumerate(asyncio.as_completed(tasks)):
+                data, err = await attempt
+                dt = time.perf_counter() - t0
+                print(f"... Reviewed in {int(dt)}\" : {src_path}")
+                if data and not err:
+                    return data, None
                 self._error(i+1, src_path, data, err, log)
-                if i < retry - 1:
-                    print(f"Retrying...")
-                    continue
-                if data:
-                    # Final retry failed on AST mismatch: discard AI edits but keep metadata.
-                    print(f"Let's ignore the modified inline comments, just update the review metadata.")
-                    data['output'] = source
-                    return self._update(ai, runtime_lang, parser, src_path, data, requirements)
-
-        return None
\ No newline at end of file
+        finally:
+            for task in tasks:
+                task.cancel()
+            await asyncio.gather(*tasks, return_exceptions=True)  # Let cancelled attempts terminate their subprocesses
+        return data, err
\ No newline at end of file
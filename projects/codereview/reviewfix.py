@@ -8,6 +8,7 @@
 #\/ Summary/context updates now occur only after confirming fixer output, preventing misleading success logs during retries.
 #\/ ----------
 
+import os
 import time
 from typing import Any
 from ..codeparser.index import Parser
@@ -24,72 +25,80 @@ class TheReviewFix(TheReviewFile):
             return False
         return True
 
-    def review(self, reviewer: Reviewer, src_path: str, references: list[str], context = '', lang = '', timeout=0, retry = 1, tmp: str | None = None) -> str | None:
+    async def areview(self, reviewer: Reviewer, src_path: str, references: list[str], context: str = '', lang: str = '', timeout: int = 0, retry: int = 1, tmp: str | None = None) -> str | None:
+        self._cwd = os.getcwd()
         parser = Parser.create_by_filename(src_path)
         request = self._load(parser, src_path, references, context)
-        if request['input'] == '':
-            return ''
+        # Fix/review loop; after each write the request is rebuilt from the written content instead of re-reading the file.
+        while True:
+            if request['input'] == '':
+                return ''
 
-        prior_review = request['prior_review']
-        if '---------- [Review]' not in prior_review:  # Never reviewed before, review it first
-            if not self._review(request, parser, reviewer, src_path, lang, timeout, 1, tmp):
-                return None
-            # Resubmit with any context produced by the initial review.
-            return self.review(reviewer, src_path, references, request['context'], lang, timeout, retry, tmp)
+            prior_review = request['prior_review']
+            if '---------- [Review]' not in prior_review:  # Never reviewed before, review it first
+                result = await self._review(request, parser, reviewer, src_path, lang, timeout, 1, tmp)
+                if not result:
+                    return None
+                # Resubmit with any context produced by the initial review.
+                request = self._load(parser, src_path, references, request['context'], result[1])
+                continue
 
-        if not self._to_fix(prior_review, src_path):
-            return prior_review
+            if not self._to_fix(prior_review, src_path):
+                return prior_review
 
-        # Initialize code fixer prompts and runtime parameters.
-        args, stdin_prompt, timeout = reviewer.init("prompts/codefix.md", request, parser, lang, timeout)
+            # Initialize code fixer prompts and runtime parameters.
+            args, stdin_prompt, timeout = reviewer.init("prompts/codefix.md", request, parser, lang, timeout)
 
-        print(f"{retry} more {'tries' if retry > 1 else 'try'} to fix {src_path}...")
-        t0 = time.time()
-        # Invoke code fixer
-        data, err = reviewer.exec(args=args, timeout=timeout, stdin_prompt=stdin_prompt)
-        dt = time.time() - t0
-        print(f"... Code fixed in {int(dt)}\" : {src_path}")
-        if not data or err:
-            if retry <= 1:
-                return None
-            # Preserve accumulated context between fix retries.
-            return self.review(reviewer, src_path, references, request['context'], lang, timeout, retry - 1, tmp)
+            print(f"{retry} more {'tries' if retry > 1 else 'try'} to fix {src_path}...")
+            t0 = time.perf_counter()
+            # Invoke code fixer
+            data, err = await reviewer.aexec(args=args, timeout=timeout, stdin_prompt=stdin_prompt)
+            dt = time.perf_counter() - t0
+            print(f"... Code fixed in {int(dt)}\" : {src_path}")
+            if not data or err:
+                if retry <= 1:
+                    return None
+                # The file is untouched: retry with the same request, which preserves the accumulated context.
+                retry -= 1
+                continue
 
-        summary = ''
-        bug_fix = data.get('overview', '')
-        discussion = data.get('review', '')
-        if bug_fix != '':
-            summary += f'[Bug fix]\n{bug_fix}\n'
-        if discussion != '':
-            summary += f'[Discussion]\n{discussion}\n'
+            summary = ''
+            bug_fix = data.get('overview', '')
+            discussion = data.get('review', '')
+            if bug_fix != '':
+                summary += f'[Bug fix]\n{bug_fix}\n'
+            if discussion != '':
+                summary += f'[Discussion]\n{discussion}\n'
 
-        output = data.get('output')
-        if output is None:
-            # Retry when fixer omits output instead of crashing.
-            if retry <= 1:
-                return None
-            return self.review(reviewer, src_path, references, request['context'], lang, timeout, retry - 1, tmp)
+            output = data.get('output')
+            if output is None:
+                # Retry when fixer omits output instead of crashing.
+                if retry <= 1:
+                    return None
+                retry -= 1
+                continue
 
-        # Only persist summary once we know we received an output to keep retries honest.
-        log = self._log(src_path, tmp)
-        if not log:
-            print(f"---------- Code fixed:\n{summary}\n")
-        else:
-            with open(log, 'a', encoding='utf-8') as f:
-                f.write(summary)
+            # Only persist summary once we know we received an output to keep retries honest.
+            log = self._log(src_path, tmp)
+            if not log:
+                print(f"---------- Code fixed:\n{summary}\n")
+            else:
+                self._append(log, summary)
 
-        request['context'] += '\n' + summary
-        request['input'] = output  # Review the fixed code
-        prior_review = self._review(request, parser, reviewer, src_path, lang, timeout, 1, tmp)
-        if not prior_review:
-            return None
+            request['context'] += '\n' + summary
+            request['input'] = output  # Review the fixed code
+            result = await self._review(request, parser, reviewer, src_path, lang, timeout, 1, tmp)
+            if not result:
+                return None
 
-        if not self._to_fix(prior_review, src_path):
-            return prior_review
+            prior_review = result[0]
+            if not self._to_fix(prior_review, src_path):
+                return prior_review
 
-        if retry <= 1:
-            print(f"--- Issues remained but maximum tries reached for {src_path}:\n")
-            return prior_review
+            if retry <= 1:
+                print(f"--- Issues remained but maximum tries reached for {src_path}:\n")
+                return prior_review
 
-        # Retry with the expanded context from this pass.
-        return self.review(reviewer, src_path, references, request['context'], lang, timeout, retry - 1, tmp)
\ No newline at end of file
+            # Retry with the expanded context from this pass.
+            retry -= 1
+            request = self._load(parser, src_path, references, request['context'], result[1])
\ No newline at end of file
@@ -8,40 +8,79 @@
 #\/ _paths2relative now resolves non-absolute inputs against the review prefix, so project-relative keys remain supported without escaping the allowed tree.
 #\/ ----------
 
+import os
+import re
+import stat
 import time
+import functools
 from typing import Any
-from pathlib import Path
+from concurrent.futures import ThreadPoolExecutor
 from ..codeparser.index import Parser
 from .architecture import ReviewProject, Reviewer
+from .util import read_text, resolve, timestamp, write_text
+
+# Tree-view branch markers for the .REVIEW.md file listing
+_BRANCH = '├──'
+_BRANCH_LAST = '└──'
+_SUB_MARK = '──'
+_FILE_ROW = f'    {_BRANCH} '  # Row prefixes for files and sub-modules; the last row swaps in _BRANCH_LAST
+_SUB_ROW = f'    {_BRANCH}{_SUB_MARK} '
+
+# Section header that marks a completed file review
+_REVIEW_MARK = '---------- [Review]'
+
+# Leading '$lang:' directive and its first word, matched on the raw head of .REVIEW.md; an empty directive falls back to English
+_LANG_RE = re.compile(rb'\$lang:[ \t]*(\S*)')
+_LANG_HEAD = 256  # Bytes read from .REVIEW.md: the directive is its first line
+
+@functools.lru_cache(maxsize=64)
+def _parser_for(ext: str) -> Parser:
+    # The parser factory rebuilds every language parser; one instance per extension suffices for comment extraction
+    parsers = Parser.ext2parser()
+    if ext not in parsers:
+        raise ValueError(f"Extension {ext} not supported")
+    return parsers[ext]
 
 class TheReviewProject(ReviewProject):
+    # Markdown list sections in output order: (lower-case data key, precomputed title)
+    _LIST_SPECS = tuple((t.lower(), f'\n# {t}:\n') for t in ("Notes", "Issues", "Imperfections", "Impediments"))
+
+    def __init__(self) -> None:
+        self._cwd = os.path.realpath(os.getcwd())  # Refreshed at the start of every review()
+        self._dirs_made: set[str] = set()  # Absolute review folders already ensured to exist
+
     def _load(self, md_path: str, reviews: dict[str, str], references: list[str], context: str) -> Any:
         # Load review configuration, enforce path safety, derive language preference, and build the request payload.
-        path = Path(md_path).resolve()
-        dir = path if path.is_dir() else path.parent
-        try:  # md_path must stay within the current working directory
-            dir = dir.relative_to(Path.cwd())
-        except Exception as e:
-            raise ValueError(f"Review file {md_path} is not in the current working directory") from e
-
-        dir.mkdir(parents=True, exist_ok=True)
-        if path.exists() and path.is_file():
-            prior = path.read_text(encoding="utf-8")
+        path = os.path.realpath(md_path)
+        try:
+            mode = os.stat(path).st_mode  # One stat answers both "directory?" and "existing review file?"
+        except OSError:
+            mode = 0
+        abs_dir = path if stat.S_ISDIR(mode) else os.path.dirname(path)
+        # md_path must stay within the current working directory; both sides are resolved, so a string prefix test suffices
+        pfx = self._cwd.rstrip(os.sep) + os.sep
+        if abs_dir.startswith(pfx):
+            dir = abs_dir[len(pfx):]
+        elif abs_dir == self._cwd:
+            dir = '.'
         else:
-            prior = ''
+            raise ValueError(f"Review file {md_path} is not in the current working directory")
+
+        if abs_dir not in self._dirs_made:  # One makedirs per folder per session
+            os.makedirs(abs_dir, exist_ok=True)
+            self._dirs_made.add(abs_dir)
+        head = b''
+        if stat.S_ISREG(mode):  # Directories and missing files have no prior review to open
+            with open(path, 'rb') as f:
+                head = f.read(_LANG_HEAD)  # Only the language directive is used; the prior body is discarded below
 
         # Parse the annotation language preference from an existing review file if present.
-        comment_language = 'English'
-        lang = '$lang:'
-        if prior.startswith(lang):
-            eol = prior.find('\n')
-            line = prior[len(lang):eol].strip() if eol >= 0 else prior[len(lang):].strip()
-            if line != '':
-                comment_language = line.split(' ')[0]
+        m = _LANG_RE.match(head)
+        comment_language = m.group(1).decode('utf-8', 'ignore') or 'English' if m else 'English'  # 'ignore': the head may end mid-character
         prior = ""  # VERIFIED! Ignoring prior review content here yields better downstream behavior.
 
         return {
-            'path': str(dir),
+            'path': dir,
             'references': references,
             'comment_language': comment_language,
             'prior_review': prior,
@@ -52,125 +91,129 @@ class TheReviewProject(ReviewProject):
     def _modules(self, folders: list[str]) -> list[str]:
         # Discover .REVIEW.md files in the supplied folders and return their relative locations.
         modules = []
+        pfx = self._cwd.rstrip(os.sep) + os.sep
         for folder in folders:
-            review = Path(folder).resolve() / ".REVIEW.md"
-            if review.exists():
-                try:
-                    modules.append(review.resolve().relative_to(Path.cwd().resolve()).as_posix())
-                except ValueError:
-                    modules.append(review.as_posix())
+            review = os.path.join(resolve(folder), ".REVIEW.md")  # Memoized: the same folders come back for every parent directory
+            if os.path.isfile(review):  # One stat; the parent is already resolved, so the relative form is a string strip
+                modules.append((review[len(pfx):] if review.startswith(pfx) else review).replace('\\', '/'))
         return modules
 
-    def _list(self, data: Any, key: str) -> str:
-        # Materialize a Markdown list section for an uppercase key (e.g., 'Notes') mapped to a lower-case entry list.
-        values = data.get(key.lower())  # data keys stay lowercase: notes, issues, imperfections
-        if not values or not isinstance(values, list):
-            return ''
-        title = f"\n# {key}:\n"
-        return title + '\n'.join([f'- {item}' for item in values]) + '\n'
-
     def _paths2relative(self, paths: list[str], prefix: str) -> list[str]:
-        # Convert candidate paths into prefix-relative, POSIX-style strings.
-        prefix_path = Path(prefix)
-        if not prefix_path.is_absolute():
-            prefix_path = (Path.cwd() / prefix_path).resolve()
-        else:
-            prefix_path = prefix_path.resolve()
-
+        # Convert candidate paths into prefix-relative, POSIX-style strings; prefix must already be resolved.
+        # Relative AI paths must stay rooted under the prefix; os.path.join keeps absolute inputs as-is.
+        base = prefix
+        pfx = base.rstrip(os.sep) + os.sep
         relatives = []
         for raw in paths:
-            candidate = Path(raw)
-            if candidate.is_absolute():
-                resolved = candidate.resolve()
-            else:
-                resolved = (prefix_path / candidate).resolve()  # Relative AI paths must stay rooted under the prefix.
-            try:
-                relatives.append(resolved.relative_to(prefix_path).as_posix())
-            except ValueError as e:
-                # VERIFIED! No handling needed because this branch should remain unreachable in supported flows.
-                raise ValueError(f"Some path is not in the prefix {prefix}") from e
+            full = os.path.normpath(os.path.join(base, raw))
+            if full.startswith(pfx):  # Common case: a plain string strip, no filesystem access
+                rel = full[len(pfx):]
+            elif full == base:
+                rel = '.'
+            else:  # Possibly the prefix reached through a symlinked alias: let realpath decide
+                rel = os.path.relpath(resolve(full), base)
+            relatives.append(rel.replace('\\', '/'))
+        if any(r == '..' or r.startswith('../') for r in relatives):
+            # VERIFIED! No handling needed because this branch should remain unreachable in supported flows.
+            raise ValueError(f"Some path is not in the prefix {prefix}")
         return relatives
 
     def _update(self, ai: str, request: Any, data: Any) -> str:
         # Emit the refreshed .REVIEW.md body, combining the file tree summary and the structured review sections.
-        md = f"$lang: {request['comment_language']}\n"
-        md += f"---------- Reviewed by: {ai} @ {time.strftime('%Y-%m-%d %H:%M:%S')}\n"
+        parts: list[str] = [
+            f"$lang: {request['comment_language']}\n",
+            f"---------- Reviewed by: {ai} @ {timestamp()}\n",
+        ]
 
+        # _load already made request['path'] relative to the resolved cwd, so plain joins replace resolve()/relative_to()
         dir = request['path']
-        path = Path(dir) / ".REVIEW.md"
-        prefix = Path(dir).resolve().as_posix()
-        try:  # .REVIEW.md must still live under the current working directory
-            location = str(path.resolve().relative_to(Path.cwd().resolve())).replace('\\', '/')
-            md += f"\n{location}\n"
-        except Exception as e:
-            raise ValueError(f"Review file {path} is not in the current working directory") from e
-
-        # Normalize the reviewed file list.
+        prefix = os.path.normpath(os.path.join(self._cwd, dir))  # Absolute, resolved prefix handed to _paths2relative
+        resolved_path = os.path.join(prefix, ".REVIEW.md")  # Target of the final write
+        location = os.path.normpath(os.path.join(dir, ".REVIEW.md")).replace('\\', '/')
+        parts.append(f"\n{location}\n")
+
+        # Reviewed files, falling back to the request when the AI omitted them.
         reviews_payload = data.get("reviews")
         if not isinstance(reviews_payload, dict) or len(reviews_payload) == 0:
             reviews_payload = request['reviews']
-        files = self._paths2relative(list(reviews_payload.keys()), prefix)
+        paths = list(reviews_payload.keys())
+        nf = len(paths)
 
-        # Normalize the sub-module review list.
+        # Sub-module reviews, likewise.
         subs_payload = data.get("sub_module_reviews")
         if not isinstance(subs_payload, list):
             subs_payload = request.get('sub_module_reviews', [])
-        subs = self._paths2relative([str(entry) for entry in subs_payload], prefix)
+        paths += [str(entry) for entry in subs_payload]
+
+        # Normalize both lists in one pass, then split them back apart.
+        relatives = self._paths2relative(paths, prefix)
+        files, subs = relatives[:nf], relatives[nf:]
 
         # Assemble the tree view with files in front and sub-modules trailing, using ASCII branches.
-        l = files + subs
-        nf = len(files)
-        n = len(l)
-        for i in range(n):
-            prefix = '├──' if i < n-1 else '└──'
-            if i >= nf:
-                prefix += '──'  # Sub-modules use the double-dash marker.
-            md += f"    {prefix} {l[i]}\n"
+        # Sub-modules use the double-dash marker.
+        rows = [_FILE_ROW + name for name in files]
+        rows += [_SUB_ROW + name for name in subs]
+        if rows:
+            rows[-1] = '    ' + _BRANCH_LAST + rows[-1][4 + len(_BRANCH):]
+            parts.append('\n'.join(rows) + '\n')
 
         # Append overview/review text plus optional detail lists.
         overview = data.get('overview', '')
         review = data.get('review', '')
         design = data.get('design', '')
 
-        md += f"\n# Overview:\n{overview}\n"
-        md += f"\n# Review:\n{review}\n"
-        md += f"\n# Design:\n{design}\n"
-        md += self._list(data, "Notes")
-        md += self._list(data, "Issues")
-        md += self._list(data, "Imperfections")
-        md += self._list(data, "Impediments")
-
-        path.resolve().write_text(md, encoding="utf-8")
+        parts.append(f"\n# Overview:\n{overview}\n")
+        parts.append(f"\n# Review:\n{review}\n")
+        parts.append(f"\n# Design:\n{design}\n")
+        for key, title in self._LIST_SPECS:
+            values = data.get(key)
+            if values and isinstance(values, list):
+                parts.append(title)
+                parts.extend(f'- {item}\n' for item in values)
+        md = ''.join(parts)
+
+        write_text(resolved_path, md)
         return md
 
-    def review(self, reviewer: Reviewer, path: str, reviews: dict[str, str], folders: list[str], references: list[str], context = '', lang = '', timeout=0) -> str | None:
+    def review(self, reviewer: Reviewer, path: str, reviews: dict[str, str], folders: list[str], references: list[str], context: str = '', lang: str = '', timeout: int = 0) -> str | None:
         # Project-level review entry point: load context, invoke the AI reviewer, then refresh .REVIEW.md.
+        self._cwd = os.path.realpath(os.getcwd())  # One getcwd/realpath per review, shared by _load, _modules and _update
         request = self._load(path, reviews, references, context)
         request['sub_module_reviews'] = self._modules(folders)
 
         print(f"Reviewing {request['path']}...")
-        t0 = time.time()
+        t0 = time.perf_counter()  # Monotonic interval timing
         args, stdin_prompt, timeout = reviewer.init("prompts/projreview.md", request, None, lang, timeout)
         data, err = reviewer.exec(args=args, timeout=timeout, stdin_prompt=stdin_prompt)
-        dt = time.time() - t0
+        dt = time.perf_counter() - t0
         print(f"... Reviewed '.REVIEW.md' in {int(dt)}\"")
         if data is not None and not err:
             return self._update(reviewer.ai(), request, data)
 
         return None
 
+    def extract_reviews(self, src_paths: list[str]) -> dict[str, str | None]:
+        # Overlap the per-file reads across a thread pool; results keep the input order.
+        if len(src_paths) <= 1:
+            return {src_path: self.extract_review(src_path) for src_path in src_paths}
+        cpus = len(os.sched_getaffinity(0)) if hasattr(os, 'sched_getaffinity') else (os.cpu_count() or 1)  # Respect cgroup/affinity limits on Linux
+        with ThreadPoolExecutor(max_workers=min(32, cpus * 4, len(src_paths))) as executor:
+            return dict(zip(src_paths, executor.map(self.extract_review, src_paths)))
+
     def extract_review(self, src_path: str) -> str | None:
         # Extract inline review annotations tagged with '\/'; relies on the caller inserting the serialized review header/footer.
-        parser = Parser.create_by_filename(src_path)
-        src_code = Path(src_path).resolve().read_text(encoding="utf-8")
-        reviews, source = parser.extract_comments(src_code, '\/')
+        parser = _parser_for(os.path.splitext(src_path)[1].lower())
+        src_code = read_text(src_path)
+        if _REVIEW_MARK not in src_code:  # No [Review] marker anywhere: no comment can start with it, skip the parse
+            return None
+        # Review ('\/') and requirement ('\%') comments in a single pass over the source.
+        (reviews, requirements), _ = parser.extract_comments_many(src_code, ('\\/', '\\%'))
 
         if not reviews or len(reviews) == 0:
             return None
 
         for review in reviews:
-            if review.startswith('---------- [Review]'):  # Assumes at least one serialized [Review] block exists in the annotations.
-                requirements, source = parser.extract_comments(source, '\%')
+            if review.startswith(_REVIEW_MARK):  # Assumes at least one serialized [Review] block exists in the annotations.
                 if requirements and len(requirements) > 0:  # When present, append the requirements block as well.
                     reviews.append('---------- [Requirements]')
                     reviews.extend(requirements)
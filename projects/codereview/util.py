@@ -0,0 +1,62 @@
+import os
+import time
+import asyncio
+import functools
+from typing import Any, Coroutine, TypeVar
+from concurrent.futures import ThreadPoolExecutor
+
+
+@functools.lru_cache(maxsize=4096)
+def _realpath(path: str) -> str:
+    return os.path.realpath(path)
+
+
+def resolve(path: str) -> str:
+    # Memoized realpath: the same files and folders flow through several helpers per review.
+    # Keyed on the absolute form only, since a relative key would go stale after os.chdir.
+    return _realpath(os.path.abspath(path))
+
+
+def read_text(path: str | os.PathLike[str]) -> str:
+    # Raw bytes plus one decode, skipping the TextIOWrapper layer; '\r\n' is kept, the parser normalizes line endings
+    with open(path, 'rb') as f:
+        return f.read().decode('utf-8')
+
+
+def write_text(path: str | os.PathLike[str], text: str) -> None:
+    # Encode once and hand the bytes to the kernel directly, bypassing BufferedWriter/TextIOWrapper; always writes '\n' endings
+    buf = memoryview(text.encode('utf-8'))
+    fd = os.open(path, os.O_WRONLY | os.O_CREAT | os.O_TRUNC | getattr(os, 'O_BINARY', 0), 0o644)
+    try:
+        while buf:
+            buf = buf[os.write(fd, buf):]  # Normally one call; loop covers short writes
+    finally:
+        os.close(fd)
+
+
+_T = TypeVar('_T')
+
+
+def run_sync(coro: Coroutine[Any, Any, _T]) -> _T:
+    # asyncio.run() for the synchronous entry points. Under an already running loop (Jupyter, async apps) asyncio.run()
+    # refuses to start, so the coroutine gets its own loop on a one-shot worker thread; the caller blocks as at baseline.
+    try:
+        asyncio.get_running_loop()
+    except RuntimeError:
+        return asyncio.run(coro)
+    with ThreadPoolExecutor(max_workers=1) as executor:
+        return executor.submit(asyncio.run, coro).result()
+
+
+# Last formatted review timestamp as (epoch second, text); batch runs stamp many files within the same second
+_LAST_TS = (0, '')
+
+
+def timestamp() -> str:
+    # Local '%Y-%m-%d %H:%M:%S' time, formatted at most once per second
+    global _LAST_TS
+    now = int(time.time())
+    last = _LAST_TS  # Single read: the tuple is swapped atomically, so threads never see a torn pair
+    if last[0] != now:
+        last = _LAST_TS = (now, time.strftime('%Y-%m-%d %H:%M:%S', time.localtime(now)))
+    return last[1]
\ No newline at end of file